@@ -1,286 +1,621 @@
-import csv
-import os
-import json
-from flask import Flask, jsonify, request, render_template_string
-from datetime import datetime
-
-# Initialize the Flask application
-app = Flask(__name__)
-
-# --- Data Persistence ---
-FILENAME = "transactions.csv"
-FIELDNAMES = ['id', 'date', 'type', 'category', 'amount']
-
-def initialize_file():
-    """Creates the CSV file with a header if it doesn't exist."""
-    if not os.path.exists(FILENAME):
-        with open(FILENAME, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-            writer.writeheader()
-
-def load_transactions():
-    """Loads all transactions from the CSV file."""
-    initialize_file()
-    with open(FILENAME, mode='r', newline='', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
-
-def save_transactions(transactions):
-    """Saves a list of transactions to the CSV file."""
-    with open(FILENAME, mode='w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(transactions)
-
-# --- HTML & JavaScript Front-End ---
-# We are embedding the HTML, CSS, and JS in a single file for simplicity.
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Personal Finance Tracker</title>
-    <!-- Tailwind CSS for styling -->
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        /* Simple style for better readability on smaller screens */
-        body { font-family: 'Inter', sans-serif; }
-        .table-cell { padding: 0.75rem; }
-    </style>
-</head>
-<body class="bg-gray-100 text-gray-800">
-
-    <div class="container mx-auto p-4 md:p-8 max-w-4xl">
-        <header class="text-center mb-8">
-            <h1 class="text-4xl font-bold text-gray-900">Personal Finance Tracker</h1>
-            <p class="text-gray-600 mt-2">A simple way to manage your income and expenses.</p>
-        </header>
-
-        <main class="grid grid-cols-1 md:grid-cols-3 gap-8">
-            
-            <!-- Add Transaction Form -->
-            <div class="md:col-span-1 bg-white p-6 rounded-lg shadow-md">
-                <h2 class="text-2xl font-semibold mb-4 border-b pb-2">Add Transaction</h2>
-                <form id="transaction-form">
-                    <div class="mb-4">
-                        <label for="type" class="block text-sm font-medium text-gray-700 mb-1">Type</label>
-                        <select id="type" name="type" required class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
-                            <option value="income">Income</option>
-                            <option value="expense">Expense</option>
-                        </select>
-                    </div>
-                    <div class="mb-4">
-                        <label for="category" class="block text-sm font-medium text-gray-700 mb-1">Category</label>
-                        <input type="text" id="category" name="category" required placeholder="e.g., Salary, Groceries" class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
-                    </div>
-                    <div class="mb-4">
-                        <label for="amount" class="block text-sm font-medium text-gray-700 mb-1">Amount</label>
-                        <input type="number" id="amount" name="amount" required step="0.01" min="0.01" placeholder="e.g., 50.99" class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
-                    </div>
-                    <button type="submit" class="w-full bg-indigo-600 text-white py-2 px-4 rounded-md hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 transition duration-150 ease-in-out">
-                        Add Transaction
-                    </button>
-                </form>
-            </div>
-
-            <!-- Transactions List & Summary -->
-            <div class="md:col-span-2 bg-white p-6 rounded-lg shadow-md">
-                <!-- Summary Section -->
-                <div id="summary" class="grid grid-cols-1 sm:grid-cols-3 gap-4 mb-6 text-center">
-                    <div class="bg-green-100 p-4 rounded-lg">
-                        <h3 class="text-sm font-medium text-green-800">Total Income</h3>
-                        <p id="total-income" class="text-2xl font-bold text-green-900">$0.00</p>
-                    </div>
-                    <div class="bg-red-100 p-4 rounded-lg">
-                        <h3 class="text-sm font-medium text-red-800">Total Expenses</h3>
-                        <p id="total-expenses" class="text-2xl font-bold text-red-900">$0.00</p>
-                    </div>
-                    <div class="bg-blue-100 p-4 rounded-lg">
-                        <h3 class="text-sm font-medium text-blue-800">Net Balance</h3>
-                        <p id="net-balance" class="text-2xl font-bold text-blue-900">$0.00</p>
-                    </div>
-                </div>
-                
-                <!-- Transactions Table -->
-                <h2 class="text-2xl font-semibold mb-4 border-b pb-2">History</h2>
-                <div class="overflow-x-auto">
-                    <table class="min-w-full divide-y divide-gray-200">
-                        <thead class="bg-gray-50">
-                            <tr>
-                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Date</th>
-                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Type</th>
-                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Category</th>
-                                <th class="table-cell text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Amount</th>
-                                <th class="table-cell text-center text-xs font-medium text-gray-500 uppercase tracking-wider">Action</th>
-                            </tr>
-                        </thead>
-                        <tbody id="transaction-list" class="bg-white divide-y divide-gray-200">
-                            <!-- JS will populate this section -->
-                            <tr><td colspan="5" class="text-center py-4 text-gray-500">Loading transactions...</td></tr>
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </main>
-    </div>
-
-    <script>
-        document.addEventListener('DOMContentLoaded', () => {
-            const form = document.getElementById('transaction-form');
-            const transactionList = document.getElementById('transaction-list');
-            
-            // --- Fetch and Display Data ---
-            const fetchAndDisplayTransactions = async () => {
-                try {
-                    const response = await fetch('/api/transactions');
-                    const transactions = await response.json();
-                    
-                    displayTransactions(transactions);
-                    displaySummary(transactions);
-                } catch (error) {
-                    console.error('Error fetching transactions:', error);
-                    transactionList.innerHTML = '<tr><td colspan="5" class="text-center py-4 text-red-500">Failed to load data.</td></tr>';
-                }
-            };
-            
-            const displayTransactions = (transactions) => {
-                transactionList.innerHTML = ''; // Clear current list
-                if (transactions.length === 0) {
-                    transactionList.innerHTML = '<tr><td colspan="5" class="text-center py-4 text-gray-500">No transactions yet.</td></tr>';
-                    return;
-                }
-                
-                transactions.slice().reverse().forEach(t => {
-                    const row = document.createElement('tr');
-                    const amountColor = t.type === 'income' ? 'text-green-600' : 'text-red-600';
-                    
-                    row.innerHTML = `
-                        <td class="table-cell whitespace-nowrap">${t.date}</td>
-                        <td class="table-cell whitespace-nowrap"><span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${t.type === 'income' ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}">${t.type}</span></td>
-                        <td class="table-cell whitespace-nowrap">${t.category}</td>
-                        <td class="table-cell whitespace-nowrap text-right font-medium ${amountColor}">$${parseFloat(t.amount).toFixed(2)}</td>
-                        <td class="table-cell text-center"><button onclick="deleteTransaction('${t.id}')" class="text-red-500 hover:text-red-700 text-xs">Delete</button></td>
-                    `;
-                    transactionList.appendChild(row);
-                });
-            };
-
-            const displaySummary = (transactions) => {
-                const totalIncome = transactions.filter(t => t.type === 'income').reduce((sum, t) => sum + parseFloat(t.amount), 0);
-                const totalExpenses = transactions.filter(t => t.type === 'expense').reduce((sum, t) => sum + parseFloat(t.amount), 0);
-                const netBalance = totalIncome - totalExpenses;
-
-                document.getElementById('total-income').textContent = `$${totalIncome.toFixed(2)}`;
-                document.getElementById('total-expenses').textContent = `$${totalExpenses.toFixed(2)}`;
-                document.getElementById('net-balance').textContent = `$${netBalance.toFixed(2)}`;
-            };
-
-            // --- Form Submission ---
-            form.addEventListener('submit', async (e) => {
-                e.preventDefault();
-                
-                const formData = {
-                    type: document.getElementById('type').value,
-                    category: document.getElementById('category').value,
-                    amount: parseFloat(document.getElementById('amount').value)
-                };
-
-                try {
-                    const response = await fetch('/api/transactions', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify(formData)
-                    });
-
-                    if (response.ok) {
-                        form.reset();
-                        fetchAndDisplayTransactions();
-                    } else {
-                        alert('Failed to add transaction.');
-                    }
-                } catch (error) {
-                    console.error('Error submitting form:', error);
-                    alert('An error occurred.');
-                }
-            });
-            
-            // --- Delete Transaction ---
-            window.deleteTransaction = async (id) => {
-                if (!confirm('Are you sure you want to delete this transaction?')) {
-                    return;
-                }
-                try {
-                    const response = await fetch(`/api/transactions/${id}`, { method: 'DELETE' });
-                    if (response.ok) {
-                        fetchAndDisplayTransactions();
-                    } else {
-                        alert('Failed to delete transaction.');
-                    }
-                } catch (error) {
-                    console.error('Error deleting transaction:', error);
-                    alert('An error occurred while deleting.');
-                }
-            };
-
-            // Initial load
-            fetchAndDisplayTransactions();
-        });
-    </script>
-</body>
-</html>
-"""
-
-# --- Flask API Endpoints ---
-
-@app.route('/')
-def index():
-    """Serves the main HTML page."""
-    return render_template_string(HTML_TEMPLATE)
-
-@app.route('/api/transactions', methods=['GET'])
-def get_transactions():
-    """API endpoint to get all transactions."""
-    transactions = load_transactions()
-    return jsonify(transactions)
-
-@app.route('/api/transactions', methods=['POST'])
-def add_transaction():
-    """API endpoint to add a new transaction."""
-    data = request.json
-    transactions = load_transactions()
-
-    new_transaction = {
-        'id': datetime.now().strftime('%Y%m%d%H%M%S%f'), # Unique ID based on timestamp
-        'date': datetime.now().strftime('%Y-%m-%d'),
-        'type': data['type'],
-        'category': data['category'],
-        'amount': data['amount']
-    }
-    
-    transactions.append(new_transaction)
-    save_transactions(transactions)
-    
-    return jsonify({'status': 'success', 'transaction': new_transaction}), 201
-
-@app.route('/api/transactions/<transaction_id>', methods=['DELETE'])
-def delete_transaction(transaction_id):
-    """API endpoint to delete a transaction by its ID."""
-    transactions = load_transactions()
-    
-    # Find the transaction to delete
-    transaction_to_delete = next((t for t in transactions if t['id'] == transaction_id), None)
-    
-    if not transaction_to_delete:
-        return jsonify({'status': 'error', 'message': 'Transaction not found'}), 404
-        
-    # Create a new list without the deleted transaction
-    updated_transactions = [t for t in transactions if t['id'] != transaction_id]
-    
-    save_transactions(updated_transactions)
-    
-    return jsonify({'status': 'success', 'message': 'Transaction deleted'})
-
-# --- Main execution ---
-if __name__ == '__main__':
-    # Using debug=True will auto-reload the server when you make changes
-    app.run(debug=True)
+import csv
+import fcntl
+import gzip
+import io
+import itertools
+import mmap
+import os
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from flask import Flask, request, render_template_string, Response
+from datetime import datetime
+
+# orjson serializes several times faster than the stdlib json module and
+# returns bytes directly; fall back to json when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Initialize the Flask application
+app = Flask(__name__)
+
+# --- Data Persistence ---
+# Transactions live in SQLite; the old CSV write-ahead log is only read once
+# to migrate existing data, and /api/export.csv still serves CSV downloads.
+DB_FILENAME = "transactions.db"
+FILENAME = "transactions.csv"
+FIELDNAMES = ['id', 'date', 'type', 'category', 'amount']
+
+# Rows are stored internally as plain tuples in this column order; dicts are
+# only built at the jsonify boundary. This avoids a per-row dict allocation
+# in the CSV parse loop.
+ID, DATE, TYPE, CATEGORY, AMOUNT = range(5)
+
+# Tombstone marker used by the legacy CSV log format (see load_transactions)
+DELETED_MARKER = '__deleted__'
+
+def connect_db():
+    """Opens the SQLite store, creating the schema on first use."""
+    conn = sqlite3.connect(DB_FILENAME, check_same_thread=False)
+    # WAL lets readers run concurrently with the single writer; NORMAL sync
+    # keeps commits durable enough without an fsync per transaction.
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('CREATE TABLE IF NOT EXISTS transactions ('
+                 'id TEXT PRIMARY KEY, date TEXT, type TEXT, '
+                 'category TEXT, amount INTEGER)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_transactions_type '
+                 'ON transactions (type)')
+    # Amounts are integer cents; databases from before this scheme stored
+    # float dollars, so convert them once and stamp the schema version.
+    if conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+        conn.execute('UPDATE transactions '
+                     'SET amount = CAST(ROUND(amount * 100) AS INTEGER)')
+        conn.execute('PRAGMA user_version = 1')
+    conn.commit()
+    return conn
+
+def to_cents(amount):
+    """Converts a dollar amount (float or string) to integer cents."""
+    return int(round(float(amount) * 100))
+
+# Optional compiled parse loop for the legacy CSV log (see fast.pyx / setup.py)
+try:
+    from fast import load_transactions_c
+except ImportError:
+    load_transactions_c = None
+
+def iter_transactions():
+    """Yields raw row tuples from the legacy CSV log one at a time.
+
+    The bytes are taken under a shared flock through an mmap view, so they
+    come straight from the kernel page cache and a writer from an older
+    deployment still appending to the log cannot interleave with the read.
+    Rows are then parsed lazily, so callers that can exit early pay only
+    for the rows they consume. Tombstone rows are yielded as-is.
+    """
+    with open(FILENAME, mode='rb') as f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # an empty file cannot be mapped (and has no rows)
+        try:
+            text = mm[:].decode('utf-8')
+        finally:
+            mm.close()
+    reader = csv.reader(io.StringIO(text, newline=''))
+    next(reader, None)  # skip the header row
+    for row in reader:
+        yield tuple(row)
+
+def load_transactions():
+    """Loads all transactions from the legacy CSV log, applying tombstones."""
+    if load_transactions_c is not None:
+        return load_transactions_c(FILENAME)
+    live = {}
+    for row in iter_transactions():
+        if row[TYPE] == DELETED_MARKER:
+            live.pop(row[ID], None)
+        else:
+            live[row[ID]] = row
+    return list(live.values())
+
+def migrate_legacy_csv(conn):
+    """One-time import of an existing transactions.csv log into SQLite.
+
+    Only runs when the database is empty; the CSV file is left in place
+    for the user to archive or delete.
+    """
+    if not os.path.exists(FILENAME):
+        return
+    if conn.execute('SELECT 1 FROM transactions LIMIT 1').fetchone() is not None:
+        return
+    conn.executemany(
+        'INSERT INTO transactions VALUES (?, ?, ?, ?, ?)',
+        [(t[ID], t[DATE], t[TYPE], t[CATEGORY], to_cents(t[AMOUNT]))
+         for t in load_transactions()])
+    conn.commit()
+
+# Ids come from a monotonic counter (seeded from the clock so restarts keep
+# climbing) plus a short random suffix against collisions across processes.
+_ID_SEQ = itertools.count(int(time.time() * 1000))
+
+def next_id():
+    """Returns a new unique transaction id."""
+    return f"{next(_ID_SEQ):x}{secrets.token_hex(2)}"
+
+# Memoized date stamp: [value, time it was computed]
+_TODAY = ['', 0.0]
+
+def today_str():
+    """Returns today's date as YYYY-MM-DD, re-running strftime at most
+    once a minute instead of on every insert."""
+    now = time.time()
+    if now - _TODAY[1] > 60:
+        _TODAY[0] = datetime.now().strftime('%Y-%m-%d')
+        _TODAY[1] = now
+    return _TODAY[0]
+
+def to_dict(transaction):
+    """Materializes a row tuple as a dict for the JSON boundary."""
+    return dict(zip(FIELDNAMES, transaction))
+
+def dumps(payload):
+    """Encodes a payload to JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+def json_response(payload, status=200):
+    """Builds an application/json Response without going through jsonify."""
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+# Load everything once at startup; endpoints read and mutate this list and
+# only touch SQLite to persist changes. The lock keeps mutations safe under
+# Flask's threaded server.
+DB = connect_db()
+migrate_legacy_csv(DB)
+# Order by rowid, i.e. insertion order: ids are opaque (migrated legacy ids
+# are decimal timestamps, new ones hex) and do not sort chronologically.
+# int() guards against databases whose amount column kept REAL affinity
+# from before the integer-cents scheme.
+TRANSACTIONS = [(r[0], r[1], r[2], r[3], int(r[4])) for r in DB.execute(
+    'SELECT id, date, type, category, amount FROM transactions ORDER BY rowid')]
+BY_ID = {t[ID]: t for t in TRANSACTIONS}
+LOCK = threading.Lock()
+
+# Serialized /api/transactions body, rebuilt lazily after each mutation
+_CACHED_JSON = None
+
+# Mutation counter; its value is the weak ETag for /api/transactions, so
+# unchanged clients get a 304 instead of the full body
+_VERSION = 0
+
+def transactions_json():
+    """Returns the serialized transaction list, re-encoding only after writes."""
+    global _CACHED_JSON
+    if _CACHED_JSON is None:
+        _CACHED_JSON = dumps([to_dict(t) for t in TRANSACTIONS])
+    return _CACHED_JSON
+
+# Running totals in integer cents, kept in step with TRANSACTIONS so the
+# summary is O(1) and never accumulates float rounding drift. The startup
+# values come from one aggregate over the type index — the whole reduction
+# runs inside SQLite's C engine rather than a per-row Python loop.
+TOTAL_INCOME = 0
+TOTAL_EXPENSES = 0
+for _type, _total in DB.execute('SELECT type, SUM(amount) FROM transactions GROUP BY type'):
+    if _type == 'income':
+        TOTAL_INCOME = int(_total)
+    elif _type == 'expense':
+        TOTAL_EXPENSES = int(_total)
+
+# --- HTML & JavaScript Front-End ---
+# We are embedding the HTML, CSS, and JS in a single file for simplicity.
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Personal Finance Tracker</title>
+    <!-- Tailwind CSS for styling -->
+    <script src="https://cdn.tailwindcss.com"></script>
+    <style>
+        /* Simple style for better readability on smaller screens */
+        body { font-family: 'Inter', sans-serif; }
+        .table-cell { padding: 0.75rem; }
+    </style>
+</head>
+<body class="bg-gray-100 text-gray-800">
+
+    <div class="container mx-auto p-4 md:p-8 max-w-4xl">
+        <header class="text-center mb-8">
+            <h1 class="text-4xl font-bold text-gray-900">Personal Finance Tracker</h1>
+            <p class="text-gray-600 mt-2">A simple way to manage your income and expenses.</p>
+        </header>
+
+        <main class="grid grid-cols-1 md:grid-cols-3 gap-8">
+            
+            <!-- Add Transaction Form -->
+            <div class="md:col-span-1 bg-white p-6 rounded-lg shadow-md">
+                <h2 class="text-2xl font-semibold mb-4 border-b pb-2">Add Transaction</h2>
+                <form id="transaction-form">
+                    <div class="mb-4">
+                        <label for="type" class="block text-sm font-medium text-gray-700 mb-1">Type</label>
+                        <select id="type" name="type" required class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
+                            <option value="income">Income</option>
+                            <option value="expense">Expense</option>
+                        </select>
+                    </div>
+                    <div class="mb-4">
+                        <label for="category" class="block text-sm font-medium text-gray-700 mb-1">Category</label>
+                        <input type="text" id="category" name="category" required placeholder="e.g., Salary, Groceries" class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
+                    </div>
+                    <div class="mb-4">
+                        <label for="amount" class="block text-sm font-medium text-gray-700 mb-1">Amount</label>
+                        <input type="number" id="amount" name="amount" required step="0.01" min="0.01" placeholder="e.g., 50.99" class="w-full p-2 border border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500">
+                    </div>
+                    <button type="submit" class="w-full bg-indigo-600 text-white py-2 px-4 rounded-md hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 transition duration-150 ease-in-out">
+                        Add Transaction
+                    </button>
+                </form>
+            </div>
+
+            <!-- Transactions List & Summary -->
+            <div class="md:col-span-2 bg-white p-6 rounded-lg shadow-md">
+                <!-- Summary Section -->
+                <div id="summary" class="grid grid-cols-1 sm:grid-cols-3 gap-4 mb-6 text-center">
+                    <div class="bg-green-100 p-4 rounded-lg">
+                        <h3 class="text-sm font-medium text-green-800">Total Income</h3>
+                        <p id="total-income" class="text-2xl font-bold text-green-900">$0.00</p>
+                    </div>
+                    <div class="bg-red-100 p-4 rounded-lg">
+                        <h3 class="text-sm font-medium text-red-800">Total Expenses</h3>
+                        <p id="total-expenses" class="text-2xl font-bold text-red-900">$0.00</p>
+                    </div>
+                    <div class="bg-blue-100 p-4 rounded-lg">
+                        <h3 class="text-sm font-medium text-blue-800">Net Balance</h3>
+                        <p id="net-balance" class="text-2xl font-bold text-blue-900">$0.00</p>
+                    </div>
+                </div>
+                
+                <!-- Transactions Table -->
+                <h2 class="text-2xl font-semibold mb-4 border-b pb-2">History</h2>
+                <div class="overflow-x-auto">
+                    <table class="min-w-full divide-y divide-gray-200">
+                        <thead class="bg-gray-50">
+                            <tr>
+                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Date</th>
+                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Type</th>
+                                <th class="table-cell text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Category</th>
+                                <th class="table-cell text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Amount</th>
+                                <th class="table-cell text-center text-xs font-medium text-gray-500 uppercase tracking-wider">Action</th>
+                            </tr>
+                        </thead>
+                        <tbody id="transaction-list" class="bg-white divide-y divide-gray-200">
+                            <!-- JS will populate this section -->
+                            <tr><td colspan="5" class="text-center py-4 text-gray-500">Loading transactions...</td></tr>
+                        </tbody>
+                    </table>
+                </div>
+                <div class="text-center mt-4">
+                    <button id="load-more" class="hidden text-indigo-600 hover:text-indigo-800 text-sm font-medium">Load more</button>
+                </div>
+            </div>
+        </main>
+    </div>
+
+    <script>
+        document.addEventListener('DOMContentLoaded', () => {
+            const form = document.getElementById('transaction-form');
+            const transactionList = document.getElementById('transaction-list');
+            const loadMoreBtn = document.getElementById('load-more');
+
+            // Rows are fetched newest-first in pages of PAGE_SIZE;
+            // loadedCount is the offset of the next page.
+            const PAGE_SIZE = 50;
+            let loadedCount = 0;
+            
+            // --- Fetch and Display Data ---
+            const fetchAndDisplayTransactions = async () => {
+                try {
+                    const [transactionsRes, summaryRes] = await Promise.all([
+                        fetch(`/api/transactions?limit=${PAGE_SIZE}`),
+                        fetch('/api/summary')
+                    ]);
+                    const transactions = await transactionsRes.json();
+                    const summary = await summaryRes.json();
+
+                    displayTransactions(transactions);
+                    displaySummary(summary);
+                } catch (error) {
+                    console.error('Error fetching transactions:', error);
+                    transactionList.innerHTML = '<tr><td colspan="5" class="text-center py-4 text-red-500">Failed to load data.</td></tr>';
+                }
+            };
+            
+            // One <tr> per transaction id, so updates can patch single rows
+            // instead of rebuilding the whole table. dataById keeps the
+            // matching transaction objects for local summary adjustments.
+            const rowsById = new Map();
+            const dataById = new Map();
+
+            const buildTransactionRow = (t) => {
+                const row = document.createElement('tr');
+                const amountColor = t.type === 'income' ? 'text-green-600' : 'text-red-600';
+
+                row.innerHTML = `
+                    <td class="table-cell whitespace-nowrap">${t.date}</td>
+                    <td class="table-cell whitespace-nowrap"><span class="px-2 inline-flex text-xs leading-5 font-semibold rounded-full ${t.type === 'income' ? 'bg-green-100 text-green-800' : 'bg-red-100 text-red-800'}">${t.type}</span></td>
+                    <td class="table-cell whitespace-nowrap">${t.category}</td>
+                    <td class="table-cell whitespace-nowrap text-right font-medium ${amountColor}">$${(t.amount / 100).toFixed(2)}</td>
+                    <td class="table-cell text-center"><button onclick="deleteTransaction('${t.id}')" class="text-red-500 hover:text-red-700 text-xs">Delete</button></td>
+                `;
+                return row;
+            };
+
+            const addTransactionRow = (t) => {
+                if (rowsById.size === 0) {
+                    transactionList.innerHTML = ''; // drop the placeholder row
+                }
+                const row = buildTransactionRow(t);
+                rowsById.set(t.id, row);
+                dataById.set(t.id, t);
+                transactionList.prepend(row); // newest on top
+                loadedCount++;
+            };
+
+            const removeTransactionRow = (id) => {
+                const row = rowsById.get(id);
+                if (row) {
+                    row.remove();
+                    rowsById.delete(id);
+                    dataById.delete(id);
+                    loadedCount--;
+                }
+                if (rowsById.size === 0) {
+                    // Older pages may still exist server-side; pull the next
+                    // one before declaring the history empty.
+                    loadOlderTransactions();
+                }
+            };
+
+            // Builds rows for one page (oldest-to-newest, as served) into a
+            // fragment, newest first, without copying the array to reverse it.
+            const buildPageFragment = (transactions) => {
+                const fragment = document.createDocumentFragment();
+                for (let i = transactions.length - 1; i >= 0; i--) {
+                    const row = buildTransactionRow(transactions[i]);
+                    rowsById.set(transactions[i].id, row);
+                    dataById.set(transactions[i].id, transactions[i]);
+                    fragment.appendChild(row);
+                }
+                return fragment;
+            };
+
+            const displayTransactions = (transactions) => {
+                rowsById.clear();
+                dataById.clear();
+                loadedCount = transactions.length;
+                transactionList.innerHTML = ''; // Clear current list
+                loadMoreBtn.classList.toggle('hidden', transactions.length < PAGE_SIZE);
+                if (transactions.length === 0) {
+                    transactionList.innerHTML = '<tr><td colspan="5" class="text-center py-4 text-gray-500">No transactions yet.</td></tr>';
+                    return;
+                }
+                transactionList.appendChild(buildPageFragment(transactions));
+            };
+
+            const loadOlderTransactions = async () => {
+                try {
+                    const response = await fetch(`/api/transactions?limit=${PAGE_SIZE}&offset=${loadedCount}`);
+                    const transactions = await response.json();
+                    if (transactions.length === 0 && rowsById.size === 0) {
+                        displayTransactions([]); // genuinely empty history
+                        return;
+                    }
+                    transactionList.appendChild(buildPageFragment(transactions));
+                    loadedCount += transactions.length;
+                    loadMoreBtn.classList.toggle('hidden', transactions.length < PAGE_SIZE);
+                } catch (error) {
+                    console.error('Error loading more transactions:', error);
+                }
+            };
+            loadMoreBtn.addEventListener('click', loadOlderTransactions);
+
+            // Local copy of the totals so mutations can adjust them without
+            // another round-trip; the server stays authoritative on refetch.
+            let summaryTotals = { total_income: 0, total_expenses: 0, net_balance: 0 };
+
+            // Amounts arrive from the API as integer cents; divide only for display
+            const renderSummary = () => {
+                document.getElementById('total-income').textContent = `$${(summaryTotals.total_income / 100).toFixed(2)}`;
+                document.getElementById('total-expenses').textContent = `$${(summaryTotals.total_expenses / 100).toFixed(2)}`;
+                document.getElementById('net-balance').textContent = `$${(summaryTotals.net_balance / 100).toFixed(2)}`;
+            };
+
+            const displaySummary = (summary) => {
+                summaryTotals = summary;
+                renderSummary();
+            };
+
+            const applySummaryDelta = (type, amount) => {
+                if (type === 'income') {
+                    summaryTotals.total_income += amount;
+                } else {
+                    summaryTotals.total_expenses += amount;
+                }
+                summaryTotals.net_balance = summaryTotals.total_income - summaryTotals.total_expenses;
+                renderSummary();
+            };
+
+            // --- Form Submission ---
+            form.addEventListener('submit', async (e) => {
+                e.preventDefault();
+                
+                const formData = {
+                    type: document.getElementById('type').value,
+                    category: document.getElementById('category').value,
+                    amount: parseFloat(document.getElementById('amount').value)
+                };
+
+                try {
+                    const response = await fetch('/api/transactions', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify(formData)
+                    });
+
+                    if (response.ok) {
+                        form.reset();
+                        // The server returns the created transaction, so the
+                        // row and totals can be patched without a refetch.
+                        const { transaction } = await response.json();
+                        addTransactionRow(transaction);
+                        applySummaryDelta(transaction.type, transaction.amount);
+                    } else {
+                        alert('Failed to add transaction.');
+                    }
+                } catch (error) {
+                    console.error('Error submitting form:', error);
+                    alert('An error occurred.');
+                }
+            });
+            
+            // --- Delete Transaction ---
+            window.deleteTransaction = async (id) => {
+                if (!confirm('Are you sure you want to delete this transaction?')) {
+                    return;
+                }
+                try {
+                    const response = await fetch(`/api/transactions/${id}`, { method: 'DELETE' });
+                    if (response.ok) {
+                        const t = dataById.get(id);
+                        removeTransactionRow(id);
+                        if (t) {
+                            applySummaryDelta(t.type, -t.amount);
+                        }
+                    } else {
+                        alert('Failed to delete transaction.');
+                    }
+                } catch (error) {
+                    console.error('Error deleting transaction:', error);
+                    alert('An error occurred while deleting.');
+                }
+            };
+
+            // Initial load, then resync with the server whenever the tab
+            // regains focus (mutations no longer refetch on their own).
+            fetchAndDisplayTransactions();
+            window.addEventListener('focus', fetchAndDisplayTransactions);
+        });
+    </script>
+</body>
+</html>
+"""
+
+# The template has no variables, so render it once at import and keep a
+# pre-compressed copy; serving / is then just handing out static bytes.
+with app.app_context():
+    _INDEX_HTML = render_template_string(HTML_TEMPLATE).encode('utf-8')
+_INDEX_GZ = gzip.compress(_INDEX_HTML, 9)
+
+# --- Flask API Endpoints ---
+
+@app.route('/')
+def index():
+    """Serves the pre-rendered main HTML page."""
+    headers = {'Cache-Control': 'public, max-age=3600', 'Vary': 'Accept-Encoding'}
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        headers['Content-Encoding'] = 'gzip'
+        return Response(_INDEX_GZ, mimetype='text/html', headers=headers)
+    return Response(_INDEX_HTML, mimetype='text/html', headers=headers)
+
+@app.route('/api/transactions', methods=['GET'])
+def get_transactions():
+    """API endpoint to get transactions, optionally paginated.
+
+    ?limit= and ?offset= page through the history newest-first: offset
+    counts rows back from the most recent transaction. Without a limit
+    the full (cached) list is returned, as before.
+    """
+    etag = f'W/"{_VERSION}"'
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304)
+
+    limit = request.args.get('limit', type=int)
+    if limit is None:
+        response = Response(transactions_json(), mimetype='application/json')
+    else:
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        end = len(TRANSACTIONS) - offset
+        page = TRANSACTIONS[max(end - max(limit, 0), 0):end] if end > 0 else []
+        response = json_response([to_dict(t) for t in page])
+    response.headers['ETag'] = etag
+    return response
+
+@app.route('/api/export.csv', methods=['GET'])
+def export_csv():
+    """API endpoint to download the full history in the old CSV format."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(FIELDNAMES)
+    # The export keeps the old dollar format, so convert cents back
+    writer.writerows((t[ID], t[DATE], t[TYPE], t[CATEGORY], '%.2f' % (t[AMOUNT] / 100))
+                     for t in TRANSACTIONS)
+    return Response(buf.getvalue(), mimetype='text/csv',
+                    headers={'Content-Disposition': 'attachment; filename=transactions.csv'})
+
+@app.route('/api/summary', methods=['GET'])
+def get_summary():
+    """API endpoint for the precomputed income/expense totals."""
+    return json_response({
+        'total_income': TOTAL_INCOME,
+        'total_expenses': TOTAL_EXPENSES,
+        'net_balance': TOTAL_INCOME - TOTAL_EXPENSES
+    })
+
+@app.route('/api/transactions', methods=['POST'])
+def add_transaction():
+    """API endpoint to add a new transaction."""
+    global TOTAL_INCOME, TOTAL_EXPENSES, _CACHED_JSON, _VERSION
+
+    data = request.json
+
+    new_transaction = (
+        next_id(),
+        today_str(),
+        data['type'],
+        data['category'],
+        to_cents(data['amount'])
+    )
+
+    with LOCK:
+        TRANSACTIONS.append(new_transaction)
+        BY_ID[new_transaction[ID]] = new_transaction
+        if data['type'] == 'income':
+            TOTAL_INCOME += new_transaction[AMOUNT]
+        else:
+            TOTAL_EXPENSES += new_transaction[AMOUNT]
+        _CACHED_JSON = None
+        _VERSION += 1
+        DB.execute('INSERT INTO transactions VALUES (?, ?, ?, ?, ?)', new_transaction)
+        DB.commit()
+
+    return json_response({'status': 'success', 'transaction': to_dict(new_transaction)}, status=201)
+
+@app.route('/api/transactions/<transaction_id>', methods=['DELETE'])
+def delete_transaction(transaction_id):
+    """API endpoint to delete a transaction by its ID."""
+    global TOTAL_INCOME, TOTAL_EXPENSES, _CACHED_JSON, _VERSION
+
+    with LOCK:
+        # The id index makes the lookup O(1) instead of a linear scan
+        transaction_to_delete = BY_ID.pop(transaction_id, None)
+
+        if not transaction_to_delete:
+            return json_response({'status': 'error', 'message': 'Transaction not found'}, status=404)
+
+        TRANSACTIONS.remove(transaction_to_delete)
+        if transaction_to_delete[TYPE] == 'income':
+            TOTAL_INCOME -= transaction_to_delete[AMOUNT]
+        else:
+            TOTAL_EXPENSES -= transaction_to_delete[AMOUNT]
+        _CACHED_JSON = None
+        _VERSION += 1
+        DB.execute('DELETE FROM transactions WHERE id = ?', (transaction_id,))
+        DB.commit()
+
+    return json_response({'status': 'success', 'message': 'Transaction deleted'})
+
+# --- Main execution ---
+if __name__ == '__main__':
+    # Werkzeug dev server, for development only; production deployments
+    # should run under gunicorn via wsgi.py (see README).
+    app.run(debug=True)
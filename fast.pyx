@@ -0,0 +1,39 @@
+# cython: language_level=3
+"""Cython build of the hot CSV parse loop.
+
+Compile with ``python setup.py build_ext --inplace``. ``Project the.py``
+falls back to its pure-Python version when this extension is missing.
+"""
+
+import csv
+import fcntl
+import io
+import mmap
+
+DELETED_MARKER = '__deleted__'
+
+cpdef list load_transactions_c(str path):
+    """Parses the CSV log into live row tuples, applying tombstones.
+
+    Reads the bytes under a shared flock through an mmap view, matching
+    iter_transactions in the main module.
+    """
+    cdef dict live = {}
+    with open(path, mode='rb') as f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return []  # an empty file cannot be mapped (and has no rows)
+        try:
+            text = mm[:].decode('utf-8')
+        finally:
+            mm.close()
+    reader = csv.reader(io.StringIO(text, newline=''))
+    next(reader, None)  # skip the header row
+    for row in reader:
+        if row[2] == DELETED_MARKER:
+            live.pop(row[0], None)
+        else:
+            live[row[0]] = tuple(row)
+    return list(live.values())
@@ -0,0 +1,7 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='personal-finance-tracker',
+    ext_modules=cythonize(['fast.pyx'], language_level=3),
+)
@@ -0,0 +1,19 @@
+"""WSGI entry point for running under a production server, e.g.
+
+    gunicorn -w 1 -k gthread --threads 4 wsgi:application
+
+Keep it at one worker: the app caches all state in process memory, so
+pre-forked workers would serve diverging data (see the README).
+
+The app module lives in "Project the.py", whose name is not importable
+directly, so it is loaded by path here.
+"""
+import importlib.util
+import pathlib
+
+_spec = importlib.util.spec_from_file_location(
+    'finance_tracker', pathlib.Path(__file__).with_name('Project the.py'))
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+application = _module.app